@@ -4,14 +4,20 @@ Discord AI Daily Summary Generator
 Fetches links from Discord channels, scrapes articles, and generates AI summaries
 """
 
+import logging
 import os
-import json
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from html.parser import HTMLParser
 from typing import List, Dict, Optional
 from urllib.parse import urlparse
+import diskcache
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from dotenv import load_dotenv
@@ -19,6 +25,14 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Per-message and per-URL tracing goes through logging at DEBUG so normal runs skip it;
+# set DEBUG=1 to see it. Only this module's logger is raised, so urllib3 never logs
+# request URLs (which carry API tokens) at DEBUG.
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+if os.getenv('DEBUG', '').strip().lower() in ('1', 'true', 'yes', 'on'):
+    logger.setLevel(logging.DEBUG)
+
 app = Flask(__name__)
 CORS(app)
 
@@ -29,46 +43,113 @@ CHANNEL_IDS = os.getenv('CHANNEL_IDS', '').split(',')
 GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
 APIFY_API_TOKEN = os.getenv('APIFY_API_TOKEN')
 
+# Scraping and Discord polling are network-bound, so a thread pool overlaps the waits
+MAX_WORKERS = 16
+
+# Summarize whatever has been scraped by this deadline instead of waiting on stragglers;
+# the default leaves room for a full Apify run plus the YouTube title fetch
+SCRAPE_DEADLINE_SECONDS = float(os.getenv('SCRAPE_DEADLINE_SECONDS', '90'))
+
+# Shared session so repeated calls to Discord, Apify and Gemini reuse keep-alive connections.
+# The pool is sized above MAX_WORKERS so concurrent scrapes to one host don't discard sockets;
+# Retry's defaults only resend idempotent methods, so POSTs are never repeated. Retry-After
+# is ignored: any scraped site could otherwise park a worker thread for as long as it asks.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3, respect_retry_after_header=False)
+))
+
+# Apify actors are run synchronously; the run is given this long before the call gives up
+APIFY_RUN_TIMEOUT_SECONDS = 60
+
+# Discord returns at most 100 messages per page; cap how far back busy channels are paged
+DISCORD_PAGE_SIZE = 100
+DISCORD_MAX_PAGES = 20
+
+# Second-precision prefix of Discord's ISO 8601 timestamps (e.g. 2024-01-31T18:04:05)
+DISCORD_TS_FORMAT = '%Y-%m-%dT%H:%M:%S'
+DISCORD_TS_LENGTH = 19
+
+# Patterns used per message and per URL, compiled once
+_URL_RE = re.compile(r'https?://[^\s<>()]+', re.IGNORECASE)
+_NORMALIZE_URL_RE = re.compile(r'^[^:/?#]+://[^/?#]+[^?#]*(?:\?[^#]+)?')
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+_YT_ID_RES = [
+    re.compile(r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([a-zA-Z0-9_-]{11})'),
+    re.compile(r'youtube\.com\/embed\/([a-zA-Z0-9_-]{11})'),
+]
+
+# Scraped articles, transcripts and threads, keyed by normalized URL, survive across runs
+ARTICLE_CACHE = diskcache.Cache(os.getenv('ARTICLE_CACHE_DIR', './article_cache'))
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Title and description live in <head>, so stop reading article pages there
+HEAD_CHUNK_BYTES = 8192
+HEAD_MAX_BYTES = 65536
+
+# Per-article content included in the Gemini prompt
+PROMPT_TEXT_CHARS = 500
+
+# Articles whose titles are identical or share at least this much of their word bigrams are sent to Gemini once
+DUPLICATE_SIMILARITY = 0.7
+_WORD_RE = re.compile(r'\w+')
+
+# Placeholders and short or fallback titles ('Reddit Thread', 'YouTube', a bare netloc) are never merged
+DEDUPE_MIN_TITLE_WORDS = 4
+_PLACEHOLDER_PREFIXES = ('[REDDIT - ', '[VIDEO - ')
+
+# Domains routed to the transcript scraper, and non-article domains to skip
+_YOUTUBE_DOMAINS = ('youtube.com', 'youtu.be')
+_SKIP_DOMAINS = ('twitter.com', 'x.com', 'imgur.com', 'giphy.com')
+
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
     """Normalize URL by removing fragments and converting to lowercase"""
-    try:
-        parsed = urlparse(url)
-        # Remove fragment
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-        if parsed.query:
-            normalized += f"?{parsed.query}"
-        return normalized.lower()
-    except:
-        return url
+    match = _NORMALIZE_URL_RE.match(url)
+    return (match.group(0) if match else url).lower()
 
 def format_date(date: datetime) -> str:
     """Format date as YYYY-MM-DD"""
     return date.strftime('%Y-%m-%d')
 
-def get_discord_messages(channel_id: str, token: str) -> List[Dict]:
-    """Fetch messages from a Discord channel"""
-    url = f"https://discord.com/api/v10/channels/{channel_id}/messages?limit=100"
+def get_discord_messages(channel_id: str, token: str, since_ts: str) -> List[Dict]:
+    """Fetch messages from a Discord channel posted at or after since_ts, newest first"""
+    url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
     headers = {
         'Authorization': f'Bot {token}' if not token.startswith('Bot ') else token,
         'Content-Type': 'application/json'
     }
     
+    # Discord pages newest to oldest; stop at the first page that crosses since_ts
+    collected = []
+    params = {'limit': DISCORD_PAGE_SIZE}
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        for _ in range(DISCORD_MAX_PAGES):
+            response = SESSION.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            batch = orjson.loads(response.content)
+            
+            for message in batch:
+                if message['timestamp'][:DISCORD_TS_LENGTH] < since_ts:
+                    return collected
+                collected.append(message)
+            
+            if len(batch) < DISCORD_PAGE_SIZE:
+                return collected
+            params['before'] = batch[-1]['id']
+        
+        print(f"Stopped fetching channel {channel_id} after {DISCORD_MAX_PAGES} pages")
+        return collected
     except Exception as e:
         print(f"Error fetching messages from channel {channel_id}: {e}")
-        return []
+        return collected
 
 def extract_youtube_id(url: str) -> Optional[str]:
     """Extract YouTube video ID from URL"""
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com\/embed\/([a-zA-Z0-9_-]{11})',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in _YT_ID_RES:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     return None
@@ -77,6 +158,19 @@ def is_reddit_url(url: str) -> bool:
     """Check if URL is a Reddit post"""
     return 'reddit.com' in url and ('/comments/' in url or '/r/' in url)
 
+def run_apify_actor(actor_id: str, payload: Dict) -> Optional[List[Dict]]:
+    """Run an Apify actor and return its dataset items in one request, or None if the run timed out"""
+    url = (
+        f"https://api.apify.com/v2/acts/{actor_id}/run-sync-get-dataset-items"
+        f"?token={APIFY_API_TOKEN}&timeout={APIFY_RUN_TIMEOUT_SECONDS}"
+    )
+    response = SESSION.post(url, json=payload, timeout=APIFY_RUN_TIMEOUT_SECONDS + 10)
+    if response.status_code == 408:
+        return None
+    # Failed or aborted runs come back as HTTP errors
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
 def get_reddit_thread(url: str) -> Optional[Dict[str, str]]:
     """Fetch Reddit thread content using Apify API"""
     if not APIFY_API_TOKEN:
@@ -84,8 +178,6 @@ def get_reddit_thread(url: str) -> Optional[Dict[str, str]]:
         return None
     
     try:
-        # Start Apify actor run
-        actor_url = f"https://api.apify.com/v2/acts/trudax~reddit-scraper/runs?token={APIFY_API_TOKEN}"
         actor_payload = {
             'startUrls': [{'url': url}],
             'sort': 'new',
@@ -99,60 +191,37 @@ def get_reddit_thread(url: str) -> Optional[Dict[str, str]]:
             }
         }
         
-        print(f"Starting Apify Reddit scraper for {url}...")
-        run_response = requests.post(actor_url, json=actor_payload, timeout=30)
-        run_response.raise_for_status()
-        run_data = run_response.json()
-        run_id = run_data['data']['id']
+        print(f"Running Apify Reddit scraper for {url}...")
+        results = run_apify_actor('trudax~reddit-scraper', actor_payload)
+        if results is None:
+            print(f"Apify run timed out for {url}")
+            return {'url': url, 'title': 'Reddit Thread', 'text': '[REDDIT - Scraping timed out]'}
         
-        # Poll for completion (max 60 seconds)
-        status_url = f"https://api.apify.com/v2/acts/trudax~reddit-scraper/runs/{run_id}?token={APIFY_API_TOKEN}"
-        for _ in range(30):  # 30 attempts * 2 seconds = 60 seconds max
-            time.sleep(2)
-            status_response = requests.get(status_url, timeout=10)
-            status_response.raise_for_status()
-            status = status_response.json()['data']['status']
+        if results:
+            post = results[0]
+            title = post.get('title', 'Reddit Thread')
+            text_content = post.get('text', '')
+            comments = post.get('comments', [])
             
-            if status == 'SUCCEEDED':
-                # Fetch dataset results
-                dataset_id = run_data['data']['defaultDatasetId']
-                dataset_url = f"https://api.apify.com/v2/datasets/{dataset_id}/items?token={APIFY_API_TOKEN}"
-                dataset_response = requests.get(dataset_url, timeout=10)
-                dataset_response.raise_for_status()
-                results = dataset_response.json()
-                
-                if results and len(results) > 0:
-                    post = results[0]
-                    title = post.get('title', 'Reddit Thread')
-                    text_content = post.get('text', '')
-                    comments = post.get('comments', [])
-                    
-                    # Combine post text and top comments
-                    content_parts = []
-                    if text_content:
-                        content_parts.append(f"Post: {text_content[:500]}")
-                    
-                    for comment in comments[:5]:  # Top 5 comments
-                        comment_text = comment.get('text', '')
-                        if comment_text:
-                            content_parts.append(f"Comment: {comment_text[:200]}")
-                    
-                    combined_text = ' | '.join(content_parts)
-                    return {
-                        'url': url,
-                        'title': title,
-                        'text': f'[REDDIT THREAD] {combined_text[:2000]}'
-                    }
-                else:
-                    print(f"No content found for {url}")
-                    return {'url': url, 'title': 'Reddit Thread', 'text': '[REDDIT - No content available]'}
+            # Combine post text and top comments
+            content_parts = []
+            if text_content:
+                content_parts.append(f"Post: {text_content[:500]}")
             
-            elif status in ['FAILED', 'ABORTED', 'TIMED-OUT']:
-                print(f"Apify run failed with status: {status}")
-                return {'url': url, 'title': 'Reddit Thread', 'text': '[REDDIT - Scraping failed]'}
+            for comment in comments[:5]:  # Top 5 comments
+                comment_text = comment.get('text', '')
+                if comment_text:
+                    content_parts.append(f"Comment: {comment_text[:200]}")
+            
+            combined_text = ' | '.join(content_parts)
+            return cache_result(url, {
+                'url': url,
+                'title': title,
+                'text': f'[REDDIT THREAD] {combined_text[:2000]}'
+            })
         
-        print(f"Apify run timed out for {url}")
-        return {'url': url, 'title': 'Reddit Thread', 'text': '[REDDIT - Scraping timed out]'}
+        print(f"No content found for {url}")
+        return {'url': url, 'title': 'Reddit Thread', 'text': '[REDDIT - No content available]'}
         
     except Exception as e:
         print(f"Error fetching Reddit thread for {url}: {e}")
@@ -172,64 +241,95 @@ def get_youtube_transcript(url: str) -> Optional[Dict[str, str]]:
     try:
         # Get video title from YouTube page
         headers = {'User-Agent': 'AI-News-Summarizer/1.0'}
-        response = requests.get(url, headers=headers, timeout=10)
-        title_match = re.search(r'<title[^>]*>([^<]+)</title>', response.text, re.IGNORECASE)
+        response = SESSION.get(url, headers=headers, timeout=10)
+        title_match = _TITLE_RE.search(response.text)
         title = title_match.group(1).strip().replace(' - YouTube', '') if title_match else f'YouTube Video {video_id}'
         
-        # Start Apify actor run
-        actor_url = f"https://api.apify.com/v2/acts/pintostudio~youtube-transcript-scraper/runs?token={APIFY_API_TOKEN}"
-        actor_payload = {"videoUrl": url}
-        
-        print(f"Starting Apify actor for {url}...")
-        run_response = requests.post(actor_url, json=actor_payload, timeout=30)
-        run_response.raise_for_status()
-        run_data = run_response.json()
-        run_id = run_data['data']['id']
+        print(f"Running Apify transcript scraper for {url}...")
+        results = run_apify_actor('pintostudio~youtube-transcript-scraper', {"videoUrl": url})
+        if results is None:
+            print(f"Apify run timed out for {url}")
+            return {'url': url, 'title': title, 'text': '[VIDEO - Transcript extraction timed out]'}
         
-        # Poll for completion (max 60 seconds)
-        status_url = f"https://api.apify.com/v2/acts/pintostudio~youtube-transcript-scraper/runs/{run_id}?token={APIFY_API_TOKEN}"
-        for _ in range(30):  # 30 attempts * 2 seconds = 60 seconds max
-            time.sleep(2)
-            status_response = requests.get(status_url, timeout=10)
-            status_response.raise_for_status()
-            status = status_response.json()['data']['status']
-            
-            if status == 'SUCCEEDED':
-                # Fetch dataset results
-                dataset_id = run_data['data']['defaultDatasetId']
-                dataset_url = f"https://api.apify.com/v2/datasets/{dataset_id}/items?token={APIFY_API_TOKEN}"
-                dataset_response = requests.get(dataset_url, timeout=10)
-                dataset_response.raise_for_status()
-                results = dataset_response.json()
-                
-                if results and len(results) > 0 and 'transcript' in results[0]:
-                    transcript_text = results[0]['transcript']
-                    return {
-                        'url': url,
-                        'title': title,
-                        'text': f'[VIDEO TRANSCRIPT] {transcript_text[:2000]}'
-                    }
-                else:
-                    print(f"No transcript available for {url}")
-                    return {'url': url, 'title': title, 'text': '[VIDEO - No transcript available]'}
-            
-            elif status in ['FAILED', 'ABORTED', 'TIMED-OUT']:
-                print(f"Apify run failed with status: {status}")
-                return {'url': url, 'title': title, 'text': '[VIDEO - Transcript extraction failed]'}
+        if results and 'transcript' in results[0]:
+            transcript_text = results[0]['transcript']
+            return cache_result(url, {
+                'url': url,
+                'title': title,
+                'text': f'[VIDEO TRANSCRIPT] {transcript_text[:2000]}'
+            })
         
-        print(f"Apify run timed out for {url}")
-        return {'url': url, 'title': title, 'text': '[VIDEO - Transcript extraction timed out]'}
+        print(f"No transcript available for {url}")
+        return {'url': url, 'title': title, 'text': '[VIDEO - No transcript available]'}
         
     except Exception as e:
         print(f"Error fetching YouTube transcript for {url}: {e}")
         return {'url': url, 'title': title if 'title' in locals() else f'YouTube Video {video_id}', 'text': '[VIDEO - Error fetching transcript]'}
 
+def host_matches(url: str, domains: tuple) -> bool:
+    """Check if the URL's host contains any of the domains, parsing only on a substring hit"""
+    if not any(domain in url for domain in domains):
+        return False
+    netloc = urlparse(url).netloc
+    return any(domain in netloc for domain in domains)
+
+def read_html_head(response: requests.Response) -> str:
+    """Read a streamed HTML response up to </head> or HEAD_MAX_BYTES"""
+    html = b''
+    for chunk in response.iter_content(HEAD_CHUNK_BYTES):
+        html += chunk
+        # Only search the new chunk plus enough overlap to catch a split tag
+        if b'</head>' in html[-(len(chunk) + 6):].lower() or len(html) >= HEAD_MAX_BYTES:
+            break
+    return html.decode(response.encoding or 'utf-8', errors='replace')
+
+class HeadMetadataParser(HTMLParser):
+    """Collect the <title> text and description <meta> content from an HTML head"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ''
+        self.description = ''
+        self._in_title = False
+        self._title_done = False
+        # The buffer can run past </head>; body elements (e.g. inline SVG <title>s) are ignored
+        self._head_done = False
+
+    def handle_starttag(self, tag, attrs):
+        if self._head_done:
+            return
+        if tag == 'title' and not self._title_done:
+            self._in_title = True
+        elif tag == 'meta' and not self.description:
+            attrs = dict(attrs)
+            name = (attrs.get('name') or attrs.get('property') or '').lower()
+            if name in ('description', 'og:description'):
+                self.description = (attrs.get('content') or '').strip()
+
+    def handle_endtag(self, tag):
+        if tag == 'title' and self._in_title:
+            self._in_title = False
+            self._title_done = True
+        elif tag == 'head':
+            self._head_done = True
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+
+def cache_result(url: str, result: Dict[str, str]) -> Dict[str, str]:
+    """Store a successful scrape result in the on-disk cache and return it"""
+    ARTICLE_CACHE.set(normalize_url(url), result, expire=CACHE_TTL_SECONDS)
+    return result
+
 def scrape_article(url: str) -> Optional[Dict[str, str]]:
-    """Scrape article content from URL"""
-    parsed = urlparse(url)
+    """Scrape article content from URL, serving previously scraped URLs from cache"""
+    cached = ARTICLE_CACHE.get(normalize_url(url))
+    if cached is not None:
+        return cached
     
     # Handle YouTube URLs separately
-    if 'youtube.com' in parsed.netloc or 'youtu.be' in parsed.netloc:
+    if host_matches(url, _YOUTUBE_DOMAINS):
         return get_youtube_transcript(url)
     
     # Handle Reddit URLs
@@ -237,40 +337,79 @@ def scrape_article(url: str) -> Optional[Dict[str, str]]:
         return get_reddit_thread(url)
     
     # Skip non-article domains
-    skip_domains = ['twitter.com', 'x.com', 'imgur.com', 'giphy.com']
-    if any(domain in parsed.netloc for domain in skip_domains):
+    if host_matches(url, _SKIP_DOMAINS):
         return None
     
     try:
         headers = {'User-Agent': 'AI-News-Summarizer/1.0'}
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        html = response.text
+        # Stream the page and close it once <head> is read, dropping the rest of the body
+        with SESSION.get(url, headers=headers, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            html = read_html_head(response)
         
-        # Extract title
-        title_match = re.search(r'<title[^>]*>([^<]+)</title>', html, re.IGNORECASE)
-        title = title_match.group(1).strip() if title_match else parsed.netloc
-        
-        # Extract meta description
-        desc_match = re.search(
-            r'<meta\s+(?:name|property)=["\'](?:description|og:description)["\']\s+content=["\']([^"\']+)["\']',
-            html, re.IGNORECASE
-        )
-        text = desc_match.group(1) if desc_match else ''
+        # Extract title and meta description
+        parser = HeadMetadataParser()
+        parser.feed(html)
+        parser.close()
+        title = ' '.join(parser.title.split()) or urlparse(url).netloc
+        text = parser.description
         
-        return {'url': url, 'title': title, 'text': text}
+        return cache_result(url, {'url': url, 'title': title, 'text': text})
     except Exception as e:
         print(f"Error scraping {url}: {e}")
         return None
 
+def title_key(article: Dict[str, str]) -> Optional[tuple]:
+    """Normalized title and its word bigrams, or None if the title is too generic to compare"""
+    if article['text'].startswith(_PLACEHOLDER_PREFIXES):
+        return None
+    if article['title'].lower() == urlparse(article['url']).netloc.lower():
+        return None
+    words = _WORD_RE.findall(article['title'].lower())
+    if len(words) < DEDUPE_MIN_TITLE_WORDS:
+        return None
+    return ' '.join(words), frozenset(zip(words, words[1:]))
+
+def dedupe_articles(articles: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Drop articles whose title duplicates an earlier one (mirrors, syndicated copies)"""
+    kept = []
+    kept_keys = []
+    for article in articles:
+        key = title_key(article)
+        if key is None:
+            kept.append(article)
+            continue
+        
+        title, bigrams = key
+        is_duplicate = False
+        for other_title, other_bigrams in kept_keys:
+            if title == other_title:
+                is_duplicate = True
+                break
+            # Jaccard similarity can't reach the threshold if the sizes differ too much
+            smaller, larger = sorted((len(bigrams), len(other_bigrams)))
+            if smaller < DUPLICATE_SIMILARITY * larger:
+                continue
+            if len(bigrams & other_bigrams) >= DUPLICATE_SIMILARITY * len(bigrams | other_bigrams):
+                is_duplicate = True
+                break
+        if not is_duplicate:
+            kept.append(article)
+            kept_keys.append(key)
+    return kept
+
 def generate_summary(articles: List[Dict[str, str]], api_key: str) -> str:
     """Generate AI summary using Google Gemini"""
     date = format_date(datetime.now())
     
-    # Prepare article list
+    unique_articles = dedupe_articles(articles)
+    if len(unique_articles) < len(articles):
+        print(f'Dropped {len(articles) - len(unique_articles)} near-duplicate articles from the prompt')
+    
+    # Prepare article list; slicing already-short text returns the same string, so only long text is copied
     article_list = '\n\n'.join([
-        f"{i+1}. {article['title']}\nURL: {article['url']}\nContent: {article['text'][:500]}"
-        for i, article in enumerate(articles)
+        f"{i}. {article['title']}\nURL: {article['url']}\nContent: {article['text'][:PROMPT_TEXT_CHARS]}"
+        for i, article in enumerate(unique_articles, 1)
     ])
     
     prompt = f"""You are an AI news curator. Extract and summarize the notable AI news from these articles and videos.
@@ -297,9 +436,9 @@ Create a concise Markdown summary titled "# Daily AI News — {date} (America/Ch
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = SESSION.post(url, json=payload)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         return data['candidates'][0]['content']['parts'][0]['text']
     except Exception as e:
         print(f"Error generating summary: {e}")
@@ -321,14 +460,14 @@ def post_to_discord(token: str, channel_id: str, content: str):
         data = {
             'content': f"# Daily AI News Summary — {format_date(datetime.now())}\n\n*Summary attached as file (too long for inline message)*"
         }
-        response = requests.post(
+        response = SESSION.post(
             url,
             headers={'Authorization': headers['Authorization']},
-            data={'payload_json': json.dumps(data)},
+            data={'payload_json': orjson.dumps(data).decode()},
             files=files
         )
     else:
-        response = requests.post(url, headers=headers, json={'content': content})
+        response = SESSION.post(url, headers=headers, json={'content': content})
     
     response.raise_for_status()
 
@@ -356,44 +495,45 @@ def generate_summary_endpoint():
         now = datetime.now(timezone.utc)
         start_time = now - timedelta(hours=48)
         
+        # Discord timestamps are fixed-format UTC ISO 8601, so second-precision prefixes sort chronologically
+        start_ts = start_time.strftime(DISCORD_TS_FORMAT)
+        
         print(f'Fetching messages from last 48 hours: {start_time} to {now}')
         
-        # Collect all URLs from messages
+        # Collect all URLs from messages; raw_urls skips exact reposts before normalization
         all_urls = set()
-        url_pattern = re.compile(r'https?://[^\s<>()]+', re.IGNORECASE)
+        raw_urls = set()
         
-        for channel_id in CHANNEL_IDS:
-            channel_id = channel_id.strip()
-            if not channel_id:
-                continue
-            
-            print(f'Fetching messages from channel {channel_id}...')
-            messages = get_discord_messages(channel_id, DISCORD_TOKEN)
-            print(f'Retrieved {len(messages)} messages from channel {channel_id}')
+        channel_ids = [channel_id.strip() for channel_id in CHANNEL_IDS if channel_id.strip()]
+        print(f'Fetching messages from {len(channel_ids)} channels...')
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            channel_messages = list(executor.map(
+                lambda channel_id: get_discord_messages(channel_id, DISCORD_TOKEN, start_ts),
+                channel_ids
+            ))
+        
+        for channel_id, messages in zip(channel_ids, channel_messages):
+            print(f'Found {len(messages)} recent messages in channel {channel_id}')
             
-            # Filter messages from last 48 hours and extract URLs
-            recent_messages = 0
+            # Extract URLs from messages in the last 48 hours
             for message in messages:
-                message_time = datetime.fromisoformat(message['timestamp'].replace('Z', '+00:00'))
-                
-                print(f'Message time (UTC): {message_time}, In range: {message_time >= start_time}')
-                
-                if message_time >= start_time:
-                    recent_messages += 1
-                    # Extract URLs from message content
-                    content_urls = url_pattern.findall(message.get('content', ''))
-                    print(f'Found {len(content_urls)} URLs in message content: {content_urls}')
-                    for url in content_urls:
+                # Extract URLs from message content, skipping the regex for messages without links
+                content = message.get('content', '')
+                content_urls = _URL_RE.findall(content) if '://' in content else []
+                logger.debug('Found %d URLs in message content: %s', len(content_urls), content_urls)
+                for url in content_urls:
+                    if url not in raw_urls:
+                        raw_urls.add(url)
                         all_urls.add(normalize_url(url))
-                    
-                    # Extract URLs from embeds
-                    for embed in message.get('embeds', []):
-                        if embed.get('url'):
-                            embed_url = embed['url']
-                            print(f'Found URL in embed: {embed_url}')
+                
+                # Extract URLs from embeds
+                for embed in message.get('embeds', []):
+                    if embed.get('url'):
+                        embed_url = embed['url']
+                        logger.debug('Found URL in embed: %s', embed_url)
+                        if embed_url not in raw_urls:
+                            raw_urls.add(embed_url)
                             all_urls.add(normalize_url(embed_url))
-            
-            print(f'Found {recent_messages} recent messages in channel {channel_id}')
         
         print(f'Found {len(all_urls)} unique URLs')
         
@@ -404,11 +544,20 @@ def generate_summary_endpoint():
         
         # Scrape articles
         print('Scraping articles...')
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        futures = [executor.submit(scrape_article, url) for url in all_urls]
         articles = []
-        for url in all_urls:
-            article_data = scrape_article(url)
-            if article_data:
-                articles.append(article_data)
+        try:
+            for future in as_completed(futures, timeout=SCRAPE_DEADLINE_SECONDS):
+                article_data = future.result()
+                if article_data:
+                    articles.append(article_data)
+        except FuturesTimeoutError:
+            pending = sum(1 for future in futures if not future.done())
+            print(f'Scrape deadline of {SCRAPE_DEADLINE_SECONDS}s reached, skipping {pending} unfinished URLs')
+        finally:
+            # Don't block on stragglers; running scrapes still finish and populate the cache
+            executor.shutdown(wait=False, cancel_futures=True)
         
         print(f'Successfully scraped {len(articles)} articles')
         